@@ -104,10 +104,12 @@ def execute_many(self, query: str, parameters_list: list) -> None:
         Raises:
             DatabaseError: If query execution fails
         """
+        if not parameters_list:
+            return
+
         try:
             with self.transaction() as conn:
-                for parameters in parameters_list:
-                    conn.execute(query, parameters)
+                conn.executemany(query, parameters_list)
         except Exception as e:
             raise DatabaseError(f"Batch query execution failed: {e}", query) from e
 
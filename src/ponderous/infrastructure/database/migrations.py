@@ -1,5 +1,9 @@
 """Database migrations for Ponderous schema setup."""
 
+from functools import cache
+
+import duckdb
+
 from ponderous.infrastructure.database.connection import DatabaseConnection
 from ponderous.shared.exceptions import DatabaseError
 
@@ -18,11 +22,24 @@ def __init__(self, db_connection: DatabaseConnection) -> None:
     def initialize_database(self) -> None:
         """Initialize database with complete schema."""
         try:
+            if self._is_up_to_date():
+                return
             self._create_migration_table()
             self._run_all_migrations()
         except Exception as e:
             raise DatabaseError(f"Database initialization failed: {e}") from e
 
+    def _is_up_to_date(self) -> bool:
+        """Check whether the latest known migration has already been applied."""
+        if not self.db.table_exists("schema_migrations"):
+            return False
+
+        result = self.db.fetch_one(
+            "SELECT COALESCE(MAX(version), 0) FROM schema_migrations"
+        )
+        latest_version = max(version for version, _, _ in self._get_migrations())
+        return result is not None and result[0] >= latest_version
+
     def _create_migration_table(self) -> None:
         """Create migration tracking table."""
         query = """
@@ -35,13 +52,21 @@ def _create_migration_table(self) -> None:
         self.db.execute_query(query)
 
     def _run_all_migrations(self) -> None:
-        """Run all pending migrations."""
+        """Run all pending migrations in a single transaction."""
         migrations = self._get_migrations()
         applied_versions = self._get_applied_migrations()
 
-        for version, description, sql in migrations:
-            if version not in applied_versions:
-                self._run_migration(version, description, sql)
+        pending = [
+            migration
+            for migration in migrations
+            if migration[0] not in applied_versions
+        ]
+        if not pending:
+            return
+
+        with self.db.transaction() as conn:
+            for version, description, sql in pending:
+                self._run_migration(conn, version, description, sql)
 
     def _get_applied_migrations(self) -> set:
         """Get set of applied migration versions."""
@@ -52,60 +77,72 @@ def _get_applied_migrations(self) -> set:
         results = self.db.fetch_all(query)
         return {row[0] for row in results}
 
-    def _run_migration(self, version: int, description: str, sql: str) -> None:
-        """Run a single migration.
+    def _run_migration(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        version: int,
+        description: str,
+        sql: str,
+    ) -> None:
+        """Run a single migration on a connection inside an open transaction.
 
         Args:
+            conn: Connection with an active transaction
             version: Migration version number
             description: Migration description
             sql: SQL commands to execute
         """
         try:
-            with self.db.transaction() as conn:
-                # Execute migration SQL
-                for statement in sql.split(";"):
-                    statement = statement.strip()
-                    if statement:
-                        conn.execute(statement)
-
-                # Record migration as applied
-                conn.execute(
-                    "INSERT INTO schema_migrations (version, description) VALUES (?, ?)",
-                    (version, description),
-                )
+            # Execute migration SQL
+            for statement in sql.split(";"):
+                statement = statement.strip()
+                if statement:
+                    conn.execute(statement)
+
+            # Record migration as applied
+            conn.execute(
+                "INSERT INTO schema_migrations (version, description) VALUES (?, ?)",
+                (version, description),
+            )
 
         except Exception as e:
             raise DatabaseError(f"Migration {version} failed: {e}") from e
 
-    def _get_migrations(self) -> list[tuple]:
-        """Get list of all migrations (version, description, sql).
+    @classmethod
+    @cache
+    def _get_migrations(cls) -> tuple[tuple[int, str, str], ...]:
+        """Get all migrations (version, description, sql).
+
+        The migration SQL is static, so the list is built once and shared
+        by every migrator instance.
 
         Returns:
-            List of migration tuples: (version, description, sql)
+            Tuple of migration tuples: (version, description, sql)
         """
-        return [
-            (1, "Create users table", self._migration_001_users()),
+        return (
+            (1, "Create users table", cls._migration_001_users()),
             (
                 2,
                 "Create collection sources table",
-                self._migration_002_collection_sources(),
+                cls._migration_002_collection_sources(),
             ),
             (
                 3,
                 "Create user collections table",
-                self._migration_003_user_collections(),
+                cls._migration_003_user_collections(),
             ),
-            (4, "Create commanders table", self._migration_004_commanders()),
-            (5, "Create deck statistics table", self._migration_005_deck_statistics()),
+            (4, "Create commanders table", cls._migration_004_commanders()),
+            (5, "Create deck statistics table", cls._migration_005_deck_statistics()),
             (
                 6,
                 "Create deck card inclusions table",
-                self._migration_006_deck_card_inclusions(),
+                cls._migration_006_deck_card_inclusions(),
             ),
-            (7, "Create indexes for performance", self._migration_007_indexes()),
-        ]
+            (7, "Create indexes for performance", cls._migration_007_indexes()),
+        )
 
-    def _migration_001_users(self) -> str:
+    @staticmethod
+    def _migration_001_users() -> str:
         """Migration 001: Create users table."""
         return """
             CREATE TABLE users (
@@ -119,7 +156,8 @@ def _migration_001_users(self) -> str:
             )
         """
 
-    def _migration_002_collection_sources(self) -> str:
+    @staticmethod
+    def _migration_002_collection_sources() -> str:
         """Migration 002: Create collection sources table."""
         return """
             CREATE TABLE collection_sources (
@@ -138,7 +176,8 @@ def _migration_002_collection_sources(self) -> str:
                 ('archidekt', 'Archidekt', 'https://archidekt.com/api', 1.0)
         """
 
-    def _migration_003_user_collections(self) -> str:
+    @staticmethod
+    def _migration_003_user_collections() -> str:
         """Migration 003: Create user collections table."""
         return """
             CREATE TABLE user_collections (
@@ -156,7 +195,8 @@ def _migration_003_user_collections(self) -> str:
             )
         """
 
-    def _migration_004_commanders(self) -> str:
+    @staticmethod
+    def _migration_004_commanders() -> str:
         """Migration 004: Create commanders table."""
         return """
             CREATE TABLE commanders (
@@ -173,7 +213,8 @@ def _migration_004_commanders(self) -> str:
             )
         """
 
-    def _migration_005_deck_statistics(self) -> str:
+    @staticmethod
+    def _migration_005_deck_statistics() -> str:
         """Migration 005: Create deck statistics table."""
         return """
             CREATE TABLE deck_statistics (
@@ -190,7 +231,8 @@ def _migration_005_deck_statistics(self) -> str:
             )
         """
 
-    def _migration_006_deck_card_inclusions(self) -> str:
+    @staticmethod
+    def _migration_006_deck_card_inclusions() -> str:
         """Migration 006: Create deck card inclusions table."""
         return """
             CREATE TABLE deck_card_inclusions (
@@ -209,7 +251,8 @@ def _migration_006_deck_card_inclusions(self) -> str:
             )
         """
 
-    def _migration_007_indexes(self) -> str:
+    @staticmethod
+    def _migration_007_indexes() -> str:
         """Migration 007: Create performance indexes."""
         return """
             -- User collections indexes
@@ -247,8 +290,7 @@ def reset_database(self) -> None:
         ]
 
         for table in tables:
-            if self.db.table_exists(table):
-                self.db.execute_query(f"DROP TABLE {table}")
+            self.db.execute_query(f"DROP TABLE IF EXISTS {table}")
 
     def get_database_info(self) -> dict:
         """Get database information and statistics.
@@ -271,29 +313,30 @@ def get_database_info(self) -> dict:
             WHERE table_schema = 'main'
         """
         tables = self.db.fetch_all(tables_query)
+        existing_tables = {row[0] for row in tables}
         info["tables"] = [row[0] for row in tables]
 
         # Get migration count
-        if self.db.table_exists("schema_migrations"):
+        if "schema_migrations" in existing_tables:
             migration_count = self.db.fetch_one(
                 "SELECT COUNT(*) FROM schema_migrations"
             )
             info["migrations_applied"] = migration_count[0] if migration_count else 0
 
         # Get user count
-        if self.db.table_exists("users"):
+        if "users" in existing_tables:
             user_count = self.db.fetch_one("SELECT COUNT(*) FROM users")
             info["total_users"] = user_count[0] if user_count else 0
 
         # Get collection count
-        if self.db.table_exists("user_collections"):
+        if "user_collections" in existing_tables:
             collection_count = self.db.fetch_one(
                 "SELECT COUNT(DISTINCT user_id) FROM user_collections"
             )
             info["total_collections"] = collection_count[0] if collection_count else 0
 
         # Get commander count
-        if self.db.table_exists("commanders"):
+        if "commanders" in existing_tables:
             commander_count = self.db.fetch_one("SELECT COUNT(*) FROM commanders")
             info["total_commanders"] = commander_count[0] if commander_count else 0
 
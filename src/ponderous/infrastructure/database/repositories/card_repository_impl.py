@@ -296,9 +296,10 @@ def find_matching_cards(
         if name_matches:
             return name_matches
 
-        # Try normalized name
+        # Try normalized name (name lookups are case-insensitive, so only
+        # retry when normalization changed more than letter casing)
         normalized_name = self.normalize_card_name(collection_name)
-        if normalized_name != collection_name:
+        if normalized_name.lower() != collection_name.lower():
             normalized_matches = self.get_by_name(normalized_name)
             if normalized_matches:
                 return normalized_matches
@@ -5,6 +5,7 @@
 database connections, and progress indicators.
 """
 
+import importlib
 import sys
 from collections.abc import Callable
 from functools import wraps
@@ -23,7 +24,6 @@
     TextColumn,
 )
 
-from ponderous.infrastructure.database import get_database_connection
 from ponderous.shared.config import get_config
 from ponderous.shared.exceptions import PonderousError
 
@@ -38,6 +38,44 @@
 }
 
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
+
+    Subcommands are registered by name as ``(module_path, attribute)`` pairs,
+    so dispatching one command does not import every other command module
+    (and the database, scraper, and HTTP stacks behind them).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eagerly and lazily registered command names."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a command, importing its module on first use."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import and return a lazily registered command."""
+        module_path, attribute = self.lazy_subcommands[cmd_name]
+        command = getattr(importlib.import_module(module_path), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command {cmd_name!r} resolved to {command!r}, not a Click command"
+            )
+        return command
+
+
 class PonderousContext:
     """CLI context object to pass data between commands."""
 
@@ -97,6 +135,8 @@ def __init__(self) -> None:
     def get_db_connection(self) -> "DatabaseConnection":
         """Get database connection, creating if needed."""
         if self._db_connection is None:
+            from ponderous.infrastructure.database import get_database_connection
+
             self._db_connection = get_database_connection()
         return self._db_connection
 
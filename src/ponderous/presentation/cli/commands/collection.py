@@ -318,7 +318,3 @@ def analyze_collection(
         console.print(f"[red]Error analyzing collection: {e}[/red]")
     finally:
         commands.close_db_connection()
-
-
-# Register commands for import
-collection_commands = [import_collection, analyze_collection]
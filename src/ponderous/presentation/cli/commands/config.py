@@ -91,7 +91,3 @@ def config_cmd(
         console.print(
             "Use --show to view current config or --init to create default config file"
         )
-
-
-# Register commands for import
-config_commands = [config_cmd]
@@ -191,7 +191,3 @@ def discover_quick(
     # TODO: Implement quick discovery logic using the same backend as discover-commanders
     warning_message("Quick discovery not yet implemented")
     console.print("Coming soon: Streamlined commander recommendations")
-
-
-# Register commands for import
-discovery_commands = [discover_commanders, discover_quick]
@@ -244,7 +244,3 @@ def edhrec_stats(ctx: click.Context, commander_name: str) -> None:  # noqa: ARG0
     # TODO: Implement EDHREC stats display
     warning_message("EDHREC statistics not yet implemented")
     console.print("Coming soon: Detailed commander statistics from EDHREC")
-
-
-# Register commands for import
-edhrec_commands = [update_edhrec, edhrec_stats]
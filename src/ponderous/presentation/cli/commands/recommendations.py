@@ -132,7 +132,3 @@ def deck_details(
     console.print(
         "Coming soon: Comprehensive deck breakdown with card-by-card analysis"
     )
-
-
-# Register commands for import
-recommendation_commands = [recommend_decks, deck_details]
@@ -495,7 +495,3 @@ def recommend_commanders(
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
     finally:
         commands.close_db_connection()
-
-
-# Register commands for import
-testing_commands = [test_cards, scrape_edhrec, recommend_commanders]
@@ -11,17 +11,42 @@
 
 from ponderous import __version__
 
-from .base import CONTEXT_SETTINGS, PonderousContext, console
-from .commands.collection import collection_commands
-from .commands.config import config_commands
-from .commands.discovery import discovery_commands
-from .commands.edhrec import edhrec_commands
-from .commands.recommendations import recommendation_commands
-from .commands.testing import testing_commands
-from .groups.user import user_group
-
-
-@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
+from .base import CONTEXT_SETTINGS, LazyGroup, PonderousContext, console
+
+_COMMANDS = "ponderous.presentation.cli.commands"
+_GROUPS = "ponderous.presentation.cli.groups"
+
+# Command name -> (module, attribute); modules are imported on first use
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    # Command groups
+    "user": (f"{_GROUPS}.user", "user_group"),
+    # Collection commands
+    "import-collection": (f"{_COMMANDS}.collection", "import_collection"),
+    "analyze-collection": (f"{_COMMANDS}.collection", "analyze_collection"),
+    # Discovery commands
+    "discover-commanders": (f"{_COMMANDS}.discovery", "discover_commanders"),
+    "discover": (f"{_COMMANDS}.discovery", "discover_quick"),
+    # Recommendation commands
+    "recommend-decks": (f"{_COMMANDS}.recommendations", "recommend_decks"),
+    "deck-details": (f"{_COMMANDS}.recommendations", "deck_details"),
+    # EDHREC commands
+    "update-edhrec": (f"{_COMMANDS}.edhrec", "update_edhrec"),
+    "edhrec-stats": (f"{_COMMANDS}.edhrec", "edhrec_stats"),
+    # Configuration commands
+    "config": (f"{_COMMANDS}.config", "config_cmd"),
+    # Testing commands
+    "test-cards": (f"{_COMMANDS}.testing", "test_cards"),
+    "scrape-edhrec": (f"{_COMMANDS}.testing", "scrape_edhrec"),
+    "recommend-commanders": (f"{_COMMANDS}.testing", "recommend_commanders"),
+}
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    context_settings=CONTEXT_SETTINGS,
+    invoke_without_command=True,
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -75,36 +100,6 @@ def cli(
         click.echo(ctx.get_help())
 
 
-def register_commands(cli_group: click.Group) -> None:
-    """Register all commands and groups with the main CLI."""
-
-    # Register command groups
-    cli_group.add_command(user_group)
-
-    # Register individual commands
-    for command in collection_commands:
-        cli_group.add_command(command)
-
-    for command in discovery_commands:
-        cli_group.add_command(command)
-
-    for command in recommendation_commands:
-        cli_group.add_command(command)
-
-    for command in edhrec_commands:
-        cli_group.add_command(command)
-
-    for command in config_commands:
-        cli_group.add_command(command)
-
-    for command in testing_commands:
-        cli_group.add_command(command)
-
-
-# Register all commands
-register_commands(cli)
-
-
 def main() -> None:
     """Main entry point for the CLI application."""
     cli()